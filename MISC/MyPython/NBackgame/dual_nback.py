@@ -4,13 +4,90 @@ A cognitive training game that tests working memory for both position and visual
 Author: Generated using Calude Opus 4.5 for HasanSiddiki
 """
 
-import tkinter as tk
-from tkinter import ttk, messagebox
 import random
 import string
-import json
+import mmap
 import os
+import time
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
+
+try:
+    import orjson  # Optional: faster statistics load/save
+except ImportError:
+    orjson = None
+
+# tkinter is imported on first GUI use (see _import_tk) so that the
+# generator/stats classes can be used without paying for Tk start-up
+tk = ttk = messagebox = None
+
+
+def _import_tk():
+    """Import the tkinter modules into module globals on first use"""
+    global tk, ttk, messagebox
+    if tk is None:
+        import tkinter as tk
+        from tkinter import ttk, messagebox
+
+# Shared read-only metadata returned when detailed metadata is disabled.
+# Only "can_match" is read by the game loop.
+_RANDOM_METADATA = MappingProxyType({"type": "random", "can_match": False})
+_ADAPTIVE_METADATA = MappingProxyType({"type": "adaptive", "can_match": True})
+
+
+def _index_excluding(draw, excluded):
+    """
+    Map a uniform draw from range(count - 1) onto range(count) minus `excluded`.
+    Pure integer helper shared by the "anything but the n-back" samplers.
+    """
+    return draw + 1 if draw >= excluded else draw
+
+
+def _json_loads(data):
+    """Parse a JSON document, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    import json  # Deferred: only needed once statistics are read or saved
+    return json.loads(data)
+
+
+def _json_dumps(data, indent=False):
+    """Serialize data to a JSON string (optionally with 2-space indentation)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    import json
+    return json.dumps(data, indent=2 if indent else None)
+
+
+def _load_json(path):
+    """Load a JSON file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return _json_loads(f.read())
+
+
+def _dump_json(data, path):
+    """Write data to a JSON file with 2-space indentation"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(_json_dumps(data, indent=True))
+
+
+@lru_cache(maxsize=256)
+def _adaptive_prob_cached(current_bin, target_bin, base_bin):
+    """Adaptive match probability for inputs already rounded to 0.01"""
+    # Calculate deviation from target
+    deviation = target_bin - current_bin
+    
+    # Adjust probability: increase if below target, decrease if above
+    # Scale factor controls how aggressively we adapt
+    scale_factor = 2.0
+    adjustment = deviation * scale_factor
+    
+    # Clamp probability between reasonable bounds
+    adjusted_prob = base_bin + adjustment
+    return max(0.1, min(0.5, adjusted_prob))
+
 
 class GameConfig:
     """Stores all game configuration settings"""
@@ -23,9 +100,20 @@ class GameConfig:
         self.string_length = 2
         self.string_type = "letters"  # letters, numbers, combination
         self.letter_case = "capital"  # capital, lowercase, combination
+        self._char_pool = None  # Cached pool, rebuilt when string settings change
     
     def get_char_pool(self):
-        """Get the character pool based on configuration"""
+        """Get the character pool based on configuration (cached)"""
+        if self._char_pool is None:
+            self._char_pool = self._build_char_pool()
+        return self._char_pool
+    
+    def invalidate_char_pool(self):
+        """Drop the cached pool after string_type or letter_case changes"""
+        self._char_pool = None
+    
+    def _build_char_pool(self):
+        """Build the character pool from string_type and letter_case"""
         if self.string_type == "letters":
             if self.letter_case == "capital":
                 return string.ascii_uppercase
@@ -42,11 +130,6 @@ class GameConfig:
                 return string.ascii_lowercase + string.digits
             else:  # full combination
                 return string.ascii_letters + string.digits
-        
-    def generate_string(self):
-        """Generate a random string based on configuration"""
-        chars = self.get_char_pool()
-        return ''.join(random.choice(chars) for _ in range(self.string_length))
 
 
 class StimulusGenerator:
@@ -55,9 +138,16 @@ class StimulusGenerator:
     constraints and adaptive tuning for balanced, engaging gameplay.
     """
     
-    def __init__(self, config):
+    # Neighbouring cell offsets used for position lures
+    _OFFSETS = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, 1), (-1, 1), (1, -1))
+    
+    def __init__(self, config, seed=None):
         self.config = config
         
+        # Per-instance RNG: independent of the global random state, and
+        # reproducible when a seed is given
+        self._rng = random.Random(seed)
+        
         # Target match rates (percentage of rounds that should have matches)
         self.target_position_match_rate = 0.25  # 25% position matches
         self.target_string_match_rate = 0.25    # 25% string matches
@@ -75,11 +165,16 @@ class StimulusGenerator:
         self.no_match_streak = 0
         self.max_streak = 4  # Maximum consecutive matches or non-matches
         
-        # History for n-back lookups
-        self.history = []
+        # History for n-back lookups as (cell_index, encoded_string) integers
+        self.history = deque(maxlen=config.n_level + 1)
         
         # Lure settings (near-matches to increase difficulty)
         self.lure_probability = 0.15  # 15% chance of generating lures
+        
+        # Detailed per-round metadata is only built when enabled (debugging/analysis)
+        self.emit_metadata = False
+        
+        self.reset()
     
     def reset(self):
         """Reset generator state for new game"""
@@ -90,7 +185,65 @@ class StimulusGenerator:
         self.position_match_streak = 0
         self.string_match_streak = 0
         self.no_match_streak = 0
-        self.history = []
+        # Only the last n+1 stimuli are ever looked up (n-back for generation,
+        # n+1-back for response checks against the previous round)
+        self.history = deque(maxlen=self.config.n_level + 1)
+        
+        # Per-game invariants (config does not change during a game)
+        self._n = self.config.n_level
+        self._gr = self.config.grid_rows
+        self._gc = self.config.grid_cols
+        self._cells = self._gr * self._gc
+        if self._cells < 2:
+            # Non-matching positions need at least one other cell to pick
+            raise ValueError("grid must have at least 2 cells")
+        self._slen = self.config.string_length
+        self._pool = tuple(self.config.get_char_pool())
+        self._pool_index = {c: i for i, c in enumerate(self._pool)}
+        # Number of distinct strings; encoded strings are exactly range(_codes)
+        self._codes = len(self._pool) ** self._slen
+        if self._codes < 2:
+            # Non-matching strings need at least one other code to pick
+            raise ValueError("string_length must be at least 1")
+        
+        # In-bounds neighbours of every cell, used for position lures
+        gr, gc = self._gr, self._gc
+        self._adjacent = {
+            (r, c): tuple((r + dr, c + dc) for dr, dc in self._OFFSETS
+                          if 0 <= r + dr < gr and 0 <= c + dc < gc)
+            for r in range(gr) for c in range(gc)
+        }
+    
+    def generate_string(self):
+        """Generate a random string from the game's character pool"""
+        return ''.join(self._rng.choices(self._pool, k=self._slen))
+    
+    def generate_code(self):
+        """Draw a uniformly random string directly in its encoded form"""
+        return self._rng.randrange(self._codes)
+    
+    def encode_string(self, s):
+        """Encode a stimulus string as a base-len(pool) integer"""
+        pool_index = self._pool_index
+        base = len(self._pool)
+        code = 0
+        for c in reversed(s):
+            code = code * base + pool_index[c]
+        return code
+    
+    def decode_string(self, code):
+        """Decode an integer produced by encode_string back to a string"""
+        pool = self._pool
+        base = len(pool)
+        chars = []
+        for _ in range(self._slen):
+            code, i = divmod(code, base)
+            chars.append(pool[i])
+        return ''.join(chars)
+    
+    def set_metadata(self, enabled):
+        """Enable or disable detailed metadata in generate_stimulus results"""
+        self.emit_metadata = bool(enabled)
     
     def get_current_match_rates(self):
         """Calculate current match rates"""
@@ -110,23 +263,16 @@ class StimulusGenerator:
         if self.matchable_rounds < 3:
             return base_prob  # Not enough data, use base probability
         
-        # Calculate deviation from target
-        deviation = target_rate - current_rate
-        
-        # Adjust probability: increase if below target, decrease if above
-        # Scale factor controls how aggressively we adapt
-        scale_factor = 2.0
-        adjustment = deviation * scale_factor
-        
-        # Clamp probability between reasonable bounds
-        adjusted_prob = base_prob + adjustment
-        return max(0.1, min(0.5, adjusted_prob))
+        # Rates repeat often at 2-decimal precision, so bin inputs and memoize
+        return _adaptive_prob_cached(
+            round(current_rate, 2), round(target_rate, 2), round(base_prob, 2)
+        )
     
     def should_force_match(self, match_type):
         """Determine if we should force a match based on streaks and rates"""
         # Prevent excessive non-match streaks
         if self.no_match_streak >= self.max_streak:
-            return random.random() < 0.6  # 60% chance to force a match
+            return self._rng.random() < 0.6  # 60% chance to force a match
         
         # Prevent excessive match streaks
         if match_type == "position" and self.position_match_streak >= self.max_streak:
@@ -141,66 +287,70 @@ class StimulusGenerator:
         if n_back_position is None:
             return self.generate_random_position()
         
-        row, col = n_back_position
-        
-        # Generate adjacent position (lure)
-        offsets = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (1, 1), (-1, 1), (1, -1)]
-        random.shuffle(offsets)
-        
-        for dr, dc in offsets:
-            new_row = row + dr
-            new_col = col + dc
-            if 0 <= new_row < self.config.grid_rows and 0 <= new_col < self.config.grid_cols:
-                return (new_row, new_col)
+        # Generate adjacent position (lure) from the precomputed neighbours
+        neighbours = self._adjacent.get(n_back_position)
+        if neighbours:
+            return self._rng.choice(neighbours)
         
         return self.generate_random_position()
     
     def generate_string_lure(self, n_back_string):
         """Generate a string that's similar to but not matching n-back"""
         if n_back_string is None or len(n_back_string) == 0:
-            return self.config.generate_string()
+            return self.generate_string()
         
-        chars = self.config.get_char_pool()
+        pool = self._pool
+        last = len(pool) - 1
         result = list(n_back_string)
         
         # Change exactly one character (makes it a near-miss)
-        change_idx = random.randint(0, len(result) - 1)
+        change_idx = self._rng.randrange(len(result))
         original_char = result[change_idx]
         
-        # Pick a different character
-        available = [c for c in chars if c != original_char]
-        if available:
-            result[change_idx] = random.choice(available)
+        # Pick a different character: draw from all but the last slot and
+        # swap in the last one if the draw hit the original character
+        if last > 0:
+            c = pool[self._rng.randrange(last)]
+            result[change_idx] = pool[last] if c == original_char else c
         
         return ''.join(result)
     
     def generate_random_position(self):
         """Generate a uniformly random position"""
-        return (
-            random.randint(0, self.config.grid_rows - 1),
-            random.randint(0, self.config.grid_cols - 1)
-        )
+        return divmod(self._rng.randrange(self._cells), self._gc)
+    
+    def generate_non_matching_position(self, n_back_position):
+        """Generate a uniformly random position guaranteed to differ from n-back"""
+        gc = self._gc
+        forbidden = n_back_position[0] * gc + n_back_position[1]
+        
+        # Sample from all cells except the forbidden one
+        idx = _index_excluding(self._rng.randrange(self._cells - 1), forbidden)
+        return divmod(idx, gc)
     
     def generate_stimulus(self):
         """
         Generate the next position and string stimulus using adaptive algorithm.
         Returns: (position, string, metadata)
         """
-        n = self.config.n_level
+        n = self._n
+        gc = self._gc
+        history = self.history
+        lure_probability = self.lure_probability
         
         # Check if we can do n-back matching yet
-        can_match = len(self.history) >= n
+        can_match = len(history) >= n
         
         if not can_match:
             # Not enough history - generate purely random
             position = self.generate_random_position()
-            stimulus_string = self.config.generate_string()
-            self.history.append((position, stimulus_string))
-            return position, stimulus_string, {"type": "random", "can_match": False}
+            code = self.generate_code()
+            history.append((position[0] * gc + position[1], code))
+            return position, self.decode_string(code), _RANDOM_METADATA
         
         self.matchable_rounds += 1
-        n_back = self.history[-n]
-        n_back_position, n_back_string = n_back
+        n_back_idx, n_back_code = history[-n]
+        n_back_position = divmod(n_back_idx, gc)
         
         # Get current match rates for adaptive tuning
         pos_rate, str_rate, dual_rate = self.get_current_match_rates()
@@ -214,9 +364,9 @@ class StimulusGenerator:
         )
         
         # Determine what kind of stimulus to generate
-        roll_pos = random.random()
-        roll_str = random.random()
-        roll_lure = random.random()
+        roll_pos = self._rng.random()
+        roll_str = self._rng.random()
+        roll_lure = self._rng.random()
         
         # Check for forced decisions based on streaks
         force_pos = self.should_force_match("position")
@@ -238,52 +388,41 @@ class StimulusGenerator:
         if pos_match:
             position = n_back_position
             self.position_matches_count += 1
-            self.position_match_streak += 1
-        elif roll_lure < self.lure_probability:
+        elif roll_lure < lure_probability:
             position = self.generate_position_lure(n_back_position)
-            self.position_match_streak = 0
         else:
             # Generate non-matching position
-            position = self.generate_random_position()
-            # Ensure it doesn't accidentally match
-            attempts = 0
-            while position == n_back_position and attempts < 10:
-                position = self.generate_random_position()
-                attempts += 1
-            self.position_match_streak = 0
-        
-        # Generate string
+            position = self.generate_non_matching_position(n_back_position)
+        
+        # Generate string (the n-back string is only decoded when it is needed)
         if str_match:
-            stimulus_string = n_back_string
+            stimulus_string = self.decode_string(n_back_code)
+            code = n_back_code
             self.string_matches_count += 1
-            self.string_match_streak += 1
-        elif roll_lure < self.lure_probability:
-            stimulus_string = self.generate_string_lure(n_back_string)
-            self.string_match_streak = 0
+        elif roll_lure < lure_probability:
+            stimulus_string = self.generate_string_lure(self.decode_string(n_back_code))
+            code = self.encode_string(stimulus_string)
         else:
-            # Generate non-matching string
-            stimulus_string = self.config.generate_string()
-            # Ensure it doesn't accidentally match
-            attempts = 0
-            while stimulus_string == n_back_string and attempts < 10:
-                stimulus_string = self.config.generate_string()
-                attempts += 1
-            self.string_match_streak = 0
+            # Generate non-matching string: sample the code space minus the
+            # n-back code, and decode only the result
+            code = _index_excluding(self._rng.randrange(self._codes - 1), n_back_code)
+            stimulus_string = self.decode_string(code)
         
-        # Track dual matches
-        if pos_match and str_match:
-            self.dual_matches_count += 1
+        # Update streaks: increment on True, reset to 0 on False
+        self.position_match_streak = (self.position_match_streak + 1) * pos_match
+        self.string_match_streak = (self.string_match_streak + 1) * str_match
+        self.no_match_streak = (self.no_match_streak + 1) * (not pos_match and not str_match)
         
-        # Track no-match streaks
-        if not pos_match and not str_match:
-            self.no_match_streak += 1
-        else:
-            self.no_match_streak = 0
+        # Track dual matches
+        self.dual_matches_count += pos_match and str_match
         
         # Store in history
-        self.history.append((position, stimulus_string))
+        history.append((position[0] * gc + position[1], code))
         
         # Build metadata
+        if not self.emit_metadata:
+            return position, stimulus_string, _ADAPTIVE_METADATA
+        
         metadata = {
             "type": "adaptive",
             "can_match": True,
@@ -291,11 +430,21 @@ class StimulusGenerator:
             "str_match": str_match,
             "pos_prob": round(pos_match_prob, 2),
             "str_prob": round(str_match_prob, 2),
-            "is_lure_pos": not pos_match and roll_lure < self.lure_probability,
-            "is_lure_str": not str_match and roll_lure < self.lure_probability
+            "is_lure_pos": not pos_match and roll_lure < lure_probability,
+            "is_lure_str": not str_match and roll_lure < lure_probability
         }
         
         return position, stimulus_string, metadata
+    
+    def generate_schedule(self, total_rounds):
+        """
+        Pre-generate the stimuli for a whole game in one pass.
+        Generation never depends on player input, so the full sequence can
+        be built up front instead of inside each timed round.
+        Returns: list of (position, string, metadata)
+        """
+        generate = self.generate_stimulus
+        return [generate() for _ in range(total_rounds)]
 
 
 class GameStats:
@@ -308,10 +457,29 @@ class GameStats:
         self.string_misses = 0
         self.string_false_alarms = 0
         self.total_rounds_played = 0
-        self.stats_file = os.path.join(os.path.dirname(__file__), "game_stats.json")
+        
+        # Last calculate_score result, keyed by the counters it was built from
+        self._score_key = None
+        self._score_data = None
+        
+        # Game records are appended one JSON object per line; high scores live
+        # in a small separate file that is only rewritten when a record is beaten
+        stats_dir = os.path.dirname(os.path.abspath(__file__))
+        self.games_file = os.path.join(stats_dir, "game_stats.jsonl")
+        self.high_scores_file = os.path.join(stats_dir, "high_scores.json")
+        self.legacy_stats_file = os.path.join(stats_dir, "game_stats.json")
         
     def calculate_score(self):
-        """Calculate overall game score"""
+        """
+        Calculate overall game score.
+        The counters only change on button presses and missed matches, so the
+        result is cached and rebuilt only when one of them differs.
+        """
+        key = (self.position_hits, self.position_misses, self.position_false_alarms,
+               self.string_hits, self.string_misses, self.string_false_alarms)
+        if key == self._score_key:
+            return self._score_data
+        
         position_correct = self.position_hits
         string_correct = self.string_hits
         
@@ -325,7 +493,8 @@ class GameStats:
         penalty = (self.position_false_alarms + self.string_false_alarms) * 5
         total_score = max(0, (position_correct + string_correct) * 10 - penalty)
         
-        return {
+        self._score_key = key
+        self._score_data = {
             "position_accuracy": round(position_accuracy, 1),
             "string_accuracy": round(string_accuracy, 1),
             "total_score": int(total_score),
@@ -336,6 +505,7 @@ class GameStats:
             "position_false_alarms": self.position_false_alarms,
             "string_false_alarms": self.string_false_alarms
         }
+        return self._score_data
     
     def reset(self):
         """Reset stats for new game"""
@@ -347,16 +517,58 @@ class GameStats:
         self.string_false_alarms = 0
         self.total_rounds_played = 0
     
-    def save_to_file(self, config, score_data):
-        """Save game results to JSON file"""
+    def migrate_legacy_stats(self):
+        """Convert the old single-file game_stats.json into the JSONL layout"""
+        if os.path.exists(self.games_file) or not os.path.exists(self.legacy_stats_file):
+            return
+        try:
+            all_stats = _load_json(self.legacy_stats_file)
+        except (OSError, ValueError):
+            return
+        
+        with open(self.games_file, 'w', encoding='utf-8') as f:
+            for game in all_stats.get("games", []):
+                f.write(_json_dumps(game) + '\n')
+        if not os.path.exists(self.high_scores_file):
+            _dump_json(all_stats.get("high_scores", {}), self.high_scores_file)
+    
+    def load_high_scores(self):
+        """Load the per-level high scores"""
+        self.migrate_legacy_stats()
+        try:
+            return _load_json(self.high_scores_file)
+        except (OSError, ValueError):
+            return {}
+    
+    def load_recent_games(self, count=20):
+        """
+        Return the last `count` saved game records, oldest first.
+        Only the tail of the log is parsed: lines are located by scanning the
+        memory-mapped file backwards for newlines.
+        """
+        self.migrate_legacy_stats()
+        games = []
         try:
-            if os.path.exists(self.stats_file):
-                with open(self.stats_file, 'r') as f:
-                    all_stats = json.load(f)
-            else:
-                all_stats = {"games": [], "high_scores": {}}
-        except:
-            all_stats = {"games": [], "high_scores": {}}
+            with open(self.games_file, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = len(mm)
+                while end > 0 and len(games) < count:
+                    start = mm.rfind(b'\n', 0, end - 1) + 1
+                    line = mm[start:end].strip()
+                    end = start
+                    if line:
+                        try:
+                            games.append(_json_loads(line))
+                        except ValueError:
+                            pass  # Skip a corrupt/partial line
+        except (OSError, ValueError):
+            pass  # Missing or empty log
+        games.reverse()
+        return games
+    
+    def save_to_file(self, config, score_data):
+        """Append the game result and update the high score if beaten"""
+        self.migrate_legacy_stats()
         
         game_record = {
             "date": datetime.now().isoformat(),
@@ -368,71 +580,127 @@ class GameStats:
             "string_accuracy": score_data["string_accuracy"]
         }
         
-        all_stats["games"].append(game_record)
+        with open(self.games_file, 'a', encoding='utf-8') as f:
+            f.write(_json_dumps(game_record) + '\n')
         
-        # Update high score
+        # Update high score (only rewrite the file when it changes)
+        high_scores = self.load_high_scores()
         level_key = f"level_{config.n_level}"
-        if level_key not in all_stats["high_scores"]:
-            all_stats["high_scores"][level_key] = score_data["total_score"]
-        else:
-            all_stats["high_scores"][level_key] = max(
-                all_stats["high_scores"][level_key], 
-                score_data["total_score"]
-            )
-        
-        with open(self.stats_file, 'w') as f:
-            json.dump(all_stats, f, indent=2)
+        if level_key not in high_scores or score_data["total_score"] > high_scores[level_key]:
+            high_scores[level_key] = score_data["total_score"]
+            _dump_json(high_scores, self.high_scores_file)
         
-        return all_stats["high_scores"].get(level_key, 0)
+        return high_scores[level_key]
 
 
 class DualNBackGame:
     """Main game class"""
     
     # Green theme colors
-    COLORS = {
-        "bg_dark": "#0a1f0a",
-        "bg_medium": "#143314",
-        "bg_light": "#1e4d1e",
-        "accent": "#2ecc71",
-        "accent_light": "#58d68d",
-        "accent_dark": "#27ae60",
-        "text": "#ecf0f1",
-        "text_dim": "#95a5a6",
-        "grid_empty": "#1a3a1a",
-        "grid_active": "#2ecc71",
-        "grid_border": "#27ae60",
-        "button_hover": "#34e079",
-        "error": "#e74c3c",
-        "warning": "#f39c12",
-        "success": "#2ecc71"
+    COLORS = SimpleNamespace(
+        bg_dark="#0a1f0a",
+        bg_medium="#143314",
+        bg_light="#1e4d1e",
+        accent="#2ecc71",
+        accent_light="#58d68d",
+        accent_dark="#27ae60",
+        text="#ecf0f1",
+        text_dim="#95a5a6",
+        grid_empty="#1a3a1a",
+        grid_active="#2ecc71",
+        grid_border="#27ae60",
+        button_hover="#34e079",
+        error="#e74c3c",
+        warning="#f39c12",
+        success="#2ecc71"
+    )
+    
+    # Combobox dropdown listbox options: (option, COLORS attribute or literal value)
+    LISTBOX_OPTIONS = (
+        ("background", "bg_light"),
+        ("foreground", "text"),
+        ("selectBackground", "accent"),
+        ("selectForeground", "bg_dark"),
+        ("font", ("Segoe UI", 10)),
+    )
+    
+    # Core settings spinbox rows: (label, config attribute, from, to, hint)
+    CORE_SPIN_ROWS = (
+        ("N-Back Level:", "n_level", 1, 9, "(Steps back to remember)"),
+        ("Grid Rows:", "grid_rows", 2, 6, "(Rows in grid)"),
+        ("Grid Columns:", "grid_cols", 2, 6, "(Columns in grid)"),
+        ("Total Rounds:", "total_rounds", 10, 100, "(Stimuli count)"),
+    )
+    
+    # Outer padding of each screen's main frame
+    SCREEN_PADDING = {
+        "settings": {"padx": 40, "pady": 30},
+        "game": {"padx": 20, "pady": 20},
+        "results": {"padx": 40, "pady": 30},
     }
     
+    # Per-type result rows: (score_data key suffix, caption)
+    RESULT_DETAIL_ROWS = (
+        ("hits", "Correct"),
+        ("misses", "Missed"),
+        ("false_alarms", "False Alarms"),
+    )
+    
     def __init__(self, root):
+        _import_tk()
         self.root = root
         self.root.title("Dual N-Back - Cognitive Training Game")
-        self.root.configure(bg=self.COLORS["bg_dark"])
+        self.root.configure(bg=self.COLORS.bg_dark)
         self.root.geometry("900x750")
         self.root.minsize(800, 700)
         
+        # Theme colours pre-resolved by Tk to canonical "#rrggbb" strings, used
+        # on the per-round update paths
+        self._color = SimpleNamespace(**{
+            name: "#%02x%02x%02x" % tuple(c >> 8 for c in self.root.winfo_rgb(value))
+            for name, value in vars(self.COLORS).items()
+        })
+        
         # Game state
         self.config = GameConfig()
         self.stats = GameStats()
         self.stimulus_generator = None  # Created when game starts
+        self.stimulus_schedule = []  # Pre-generated (position, string, metadata) per round
         self.is_playing = False
         self.is_paused = False
         self.current_round = 0
-        self.history = []  # List of (position, string) tuples
+        # Last n_level + 1 (position, string) tuples; replaced in start_game
+        self.history = deque(maxlen=self.config.n_level + 1)
+        self._n_back_target = None  # history[-(n_level + 1)] for the current round
         self.current_position = None
         self.current_string = None
         self.position_pressed = False
         self.string_pressed = False
         self.timer_id = None
+        self._next_deadline = 0  # time.monotonic_ns() deadline of the next round
+        # Bumped on start/pause/resume/end; a scheduled round only runs if the
+        # generation it was scheduled in is still current (see _next_round_if)
+        self._gen = 0
         
-        # Grid cells
+        # Grid cells: canvas item ids, flat list indexed by row * grid_cols + col
         self.grid_cells = []
+        # Cell size and (x1, y1, x2, y2) per cell, same order; set in apply_settings
+        self._cell_size = 0
+        self._cell_coords = []
+        
+        # Screens are built once and then shown/hidden (see _show_screen)
+        self._screens = {}
+        self._current_screen = None
         
-        # Set up styles
+        # Settings spinbox name -> (label, min, max), filled by _add_spin_row
+        self._spin_ranges = {}
+        
+        # Last option values applied to each game widget (see _update_widget)
+        self._rendered = {}
+        self._var_values = {}  # Tcl variable name -> last value set by _set_var
+        
+        # Set up styles (configured once; see setup_styles)
+        self._style_ready = False
         self.setup_styles()
         
         # Show settings screen
@@ -447,114 +715,127 @@ class DualNBackGame:
         self.root.bind('<Escape>', lambda e: self.end_game())
     
     def setup_styles(self):
-        """Configure ttk styles for green theme"""
+        """Configure ttk styles for green theme (only the first call does any work)"""
+        if self._style_ready:
+            return
         style = ttk.Style()
         style.theme_use('clam')
         
         # Configure common styles
-        style.configure("Green.TFrame", background=self.COLORS["bg_dark"])
-        style.configure("GreenLight.TFrame", background=self.COLORS["bg_medium"])
+        style.configure("Green.TFrame", background=self.COLORS.bg_dark)
+        style.configure("GreenLight.TFrame", background=self.COLORS.bg_medium)
         
         style.configure("Green.TLabel", 
-                       background=self.COLORS["bg_dark"],
-                       foreground=self.COLORS["text"],
+                       background=self.COLORS.bg_dark,
+                       foreground=self.COLORS.text,
                        font=("Segoe UI", 11))
         
         style.configure("GreenTitle.TLabel",
-                       background=self.COLORS["bg_dark"],
-                       foreground=self.COLORS["accent"],
+                       background=self.COLORS.bg_dark,
+                       foreground=self.COLORS.accent,
                        font=("Segoe UI", 24, "bold"))
         
         style.configure("GreenSubtitle.TLabel",
-                       background=self.COLORS["bg_dark"],
-                       foreground=self.COLORS["text_dim"],
+                       background=self.COLORS.bg_dark,
+                       foreground=self.COLORS.text_dim,
                        font=("Segoe UI", 10))
         
         style.configure("GreenBig.TLabel",
-                       background=self.COLORS["bg_dark"],
-                       foreground=self.COLORS["accent_light"],
+                       background=self.COLORS.bg_dark,
+                       foreground=self.COLORS.accent_light,
                        font=("Segoe UI", 16, "bold"))
         
         style.configure("Green.TButton",
-                       background=self.COLORS["accent"],
-                       foreground=self.COLORS["bg_dark"],
+                       background=self.COLORS.accent,
+                       foreground=self.COLORS.bg_dark,
                        font=("Segoe UI", 11, "bold"),
                        padding=(20, 10))
         
         style.map("Green.TButton",
-                 background=[('active', self.COLORS["button_hover"]),
-                            ('pressed', self.COLORS["accent_dark"])])
+                 background=[('active', self.COLORS.button_hover),
+                            ('pressed', self.COLORS.accent_dark)])
         
         style.configure("GreenSecondary.TButton",
-                       background=self.COLORS["bg_light"],
-                       foreground=self.COLORS["text"],
+                       background=self.COLORS.bg_light,
+                       foreground=self.COLORS.text,
                        font=("Segoe UI", 10),
                        padding=(15, 8))
         
         style.map("GreenSecondary.TButton",
-                 background=[('active', self.COLORS["bg_medium"])])
+                 background=[('active', self.COLORS.bg_medium)])
         
         # Combobox styling with green theme
         style.configure("Green.TCombobox",
-                       fieldbackground=self.COLORS["bg_light"],
-                       background=self.COLORS["accent"],
-                       foreground=self.COLORS["text"],
-                       arrowcolor=self.COLORS["accent"],
-                       bordercolor=self.COLORS["accent"],
-                       lightcolor=self.COLORS["bg_light"],
-                       darkcolor=self.COLORS["bg_dark"])
+                       fieldbackground=self.COLORS.bg_light,
+                       background=self.COLORS.accent,
+                       foreground=self.COLORS.text,
+                       arrowcolor=self.COLORS.accent,
+                       bordercolor=self.COLORS.accent,
+                       lightcolor=self.COLORS.bg_light,
+                       darkcolor=self.COLORS.bg_dark)
         
         style.map("Green.TCombobox",
-                 fieldbackground=[('readonly', self.COLORS["bg_light"]),
-                                  ('disabled', self.COLORS["bg_dark"])],
-                 foreground=[('readonly', self.COLORS["text"]),
-                            ('disabled', self.COLORS["text_dim"])],
-                 background=[('active', self.COLORS["accent"]),
-                            ('pressed', self.COLORS["accent_dark"])],
-                 arrowcolor=[('disabled', self.COLORS["text_dim"])])
+                 fieldbackground=[('readonly', self.COLORS.bg_light),
+                                  ('disabled', self.COLORS.bg_dark)],
+                 foreground=[('readonly', self.COLORS.text),
+                            ('disabled', self.COLORS.text_dim)],
+                 background=[('active', self.COLORS.accent),
+                            ('pressed', self.COLORS.accent_dark)],
+                 arrowcolor=[('disabled', self.COLORS.text_dim)])
         
         # Configure the dropdown listbox colors using option_add
-        self.root.option_add('*TCombobox*Listbox.background', self.COLORS["bg_light"])
-        self.root.option_add('*TCombobox*Listbox.foreground', self.COLORS["text"])
-        self.root.option_add('*TCombobox*Listbox.selectBackground', self.COLORS["accent"])
-        self.root.option_add('*TCombobox*Listbox.selectForeground', self.COLORS["bg_dark"])
-        self.root.option_add('*TCombobox*Listbox.font', ('Segoe UI', 10))
+        option_add = self.root.option_add
+        for option, value in self.LISTBOX_OPTIONS:
+            option_add('*TCombobox*Listbox.' + option,
+                       getattr(self.COLORS, value) if isinstance(value, str) else value)
         
         # Spinbox styling with green theme
         style.configure("Green.TSpinbox",
-                       fieldbackground=self.COLORS["bg_light"],
-                       background=self.COLORS["accent"],
-                       foreground=self.COLORS["text"],
-                       arrowcolor=self.COLORS["accent"],
-                       bordercolor=self.COLORS["accent"])
+                       fieldbackground=self.COLORS.bg_light,
+                       background=self.COLORS.accent,
+                       foreground=self.COLORS.text,
+                       arrowcolor=self.COLORS.accent,
+                       bordercolor=self.COLORS.accent)
         
         style.map("Green.TSpinbox",
-                 fieldbackground=[('readonly', self.COLORS["bg_light"])],
-                 foreground=[('readonly', self.COLORS["text"])],
-                 arrowcolor=[('disabled', self.COLORS["text_dim"])])
+                 fieldbackground=[('readonly', self.COLORS.bg_light)],
+                 foreground=[('readonly', self.COLORS.text)],
+                 arrowcolor=[('disabled', self.COLORS.text_dim)])
         
         style.configure("Green.TLabelframe",
-                       background=self.COLORS["bg_dark"],
-                       foreground=self.COLORS["accent"])
+                       background=self.COLORS.bg_dark,
+                       foreground=self.COLORS.accent)
         
         style.configure("Green.TLabelframe.Label",
-                       background=self.COLORS["bg_dark"],
-                       foreground=self.COLORS["accent"],
+                       background=self.COLORS.bg_dark,
+                       foreground=self.COLORS.accent,
                        font=("Segoe UI", 11, "bold"))
+        
+        self._style_ready = True
     
-    def clear_screen(self):
-        """Remove all widgets from root"""
-        for widget in self.root.winfo_children():
-            widget.destroy()
+    def _show_screen(self, name, builder):
+        """
+        Show the cached frame for a screen, building it on first use.
+        The previously shown screen is only hidden, never destroyed.
+        """
+        frame = self._screens.get(name)
+        if frame is None:
+            frame = self._screens[name] = builder()
+        if self._current_screen is not frame:
+            if self._current_screen is not None:
+                self._current_screen.pack_forget()
+            frame.pack(fill=tk.BOTH, expand=True, **self.SCREEN_PADDING[name])
+            self._current_screen = frame
     
     def show_settings_screen(self):
         """Display the pre-game settings screen"""
-        self.clear_screen()
         self.is_playing = False
-        
+        self._show_screen("settings", self._build_settings_screen)
+    
+    def _build_settings_screen(self):
+        """Create the settings screen widgets (once)"""
         # Main container
         main_frame = ttk.Frame(self.root, style="Green.TFrame")
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=40, pady=30)
         
         # Title
         title_label = ttk.Label(main_frame, text="🧠 DUAL N-BACK", style="GreenTitle.TLabel")
@@ -575,58 +856,13 @@ class DualNBackGame:
         left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
         
         # Use grid layout for proper alignment
-        row = 0
-        
-        # N-Level
-        ttk.Label(left_frame, text="N-Back Level:", style="Green.TLabel").grid(
-            row=row, column=0, sticky=tk.W, pady=8)
-        self.n_level_var = tk.StringVar(value=str(self.config.n_level))
-        ttk.Spinbox(left_frame, from_=1, to=9, width=8, textvariable=self.n_level_var, style="Green.TSpinbox").grid(
-            row=row, column=1, sticky=tk.W, padx=10, pady=8)
-        ttk.Label(left_frame, text="(Steps back to remember)", style="GreenSubtitle.TLabel").grid(
-            row=row, column=2, sticky=tk.W, pady=8)
-        row += 1
-        
-        # Grid Rows
-        ttk.Label(left_frame, text="Grid Rows:", style="Green.TLabel").grid(
-            row=row, column=0, sticky=tk.W, pady=8)
-        self.grid_rows_var = tk.StringVar(value=str(self.config.grid_rows))
-        ttk.Spinbox(left_frame, from_=2, to=6, width=8, textvariable=self.grid_rows_var, style="Green.TSpinbox").grid(
-            row=row, column=1, sticky=tk.W, padx=10, pady=8)
-        ttk.Label(left_frame, text="(Rows in grid)", style="GreenSubtitle.TLabel").grid(
-            row=row, column=2, sticky=tk.W, pady=8)
-        row += 1
-        
-        # Grid Columns
-        ttk.Label(left_frame, text="Grid Columns:", style="Green.TLabel").grid(
-            row=row, column=0, sticky=tk.W, pady=8)
-        self.grid_cols_var = tk.StringVar(value=str(self.config.grid_cols))
-        ttk.Spinbox(left_frame, from_=2, to=6, width=8, textvariable=self.grid_cols_var, style="Green.TSpinbox").grid(
-            row=row, column=1, sticky=tk.W, padx=10, pady=8)
-        ttk.Label(left_frame, text="(Columns in grid)", style="GreenSubtitle.TLabel").grid(
-            row=row, column=2, sticky=tk.W, pady=8)
-        row += 1
+        for row, spec in enumerate(self.CORE_SPIN_ROWS):
+            self._add_spin_row(left_frame, row, *spec)
         
-        # Total Rounds
-        ttk.Label(left_frame, text="Total Rounds:", style="Green.TLabel").grid(
-            row=row, column=0, sticky=tk.W, pady=8)
-        self.total_rounds_var = tk.StringVar(value=str(self.config.total_rounds))
-        ttk.Spinbox(left_frame, from_=10, to=100, width=8, textvariable=self.total_rounds_var, style="Green.TSpinbox").grid(
-            row=row, column=1, sticky=tk.W, padx=10, pady=8)
-        ttk.Label(left_frame, text="(Stimuli count)", style="GreenSubtitle.TLabel").grid(
-            row=row, column=2, sticky=tk.W, pady=8)
-        row += 1
-        
-        # Round Duration
-        ttk.Label(left_frame, text="Round Duration:", style="Green.TLabel").grid(
-            row=row, column=0, sticky=tk.W, pady=8)
-        duration_frame = ttk.Frame(left_frame, style="Green.TFrame")
-        duration_frame.grid(row=row, column=1, sticky=tk.W, padx=10, pady=8)
-        self.round_duration_var = tk.StringVar(value=str(self.config.round_duration // 1000))
-        ttk.Spinbox(duration_frame, from_=1, to=10, width=5, textvariable=self.round_duration_var, style="Green.TSpinbox").pack(side=tk.LEFT)
-        ttk.Label(duration_frame, text=" sec", style="Green.TLabel").pack(side=tk.LEFT)
-        ttk.Label(left_frame, text="(Time per stimulus)", style="GreenSubtitle.TLabel").grid(
-            row=row, column=2, sticky=tk.W, pady=8)
+        # Round Duration (shown in seconds, stored in milliseconds)
+        self._add_spin_row(left_frame, len(self.CORE_SPIN_ROWS), "Round Duration:",
+                           "round_duration", 1, 10, "(Time per stimulus)",
+                           value=self.config.round_duration // 1000, suffix=" sec")
         
         # Right column - String settings
         right_frame = ttk.LabelFrame(settings_frame, text=" String Settings ",
@@ -636,13 +872,8 @@ class DualNBackGame:
         row = 0
         
         # String Length
-        ttk.Label(right_frame, text="String Length:", style="Green.TLabel").grid(
-            row=row, column=0, sticky=tk.W, pady=8)
-        self.string_length_var = tk.StringVar(value=str(self.config.string_length))
-        ttk.Spinbox(right_frame, from_=1, to=6, width=8, textvariable=self.string_length_var, style="Green.TSpinbox").grid(
-            row=row, column=1, sticky=tk.W, padx=10, pady=8)
-        ttk.Label(right_frame, text="(Characters per string)", style="GreenSubtitle.TLabel").grid(
-            row=row, column=2, sticky=tk.W, pady=8)
+        self._add_spin_row(right_frame, row, "String Length:", "string_length",
+                           1, 6, "(Characters per string)")
         row += 1
         
         # String Type
@@ -715,6 +946,33 @@ class DualNBackGame:
             btn = ttk.Button(preset_frame, text=name, style="GreenSecondary.TButton",
                             command=lambda n=n, r=rounds: self.apply_preset(n, r))
             btn.pack(side=tk.LEFT, padx=5)
+        
+        return main_frame
+    
+    def _add_spin_row(self, parent, row, label, name, lo, hi, hint, value=None, suffix=None):
+        """
+        Add a label / spinbox / hint row to a settings grid.
+        The spinbox variable is stored as self.<name>_var and initialised from
+        config.<name> unless an explicit value is given.
+        """
+        if value is None:
+            value = getattr(self.config, name)
+        var = tk.StringVar(value=str(value))
+        setattr(self, name + "_var", var)
+        self._spin_ranges[name] = (label, lo, hi)
+        
+        ttk.Label(parent, text=label, style="Green.TLabel").grid(
+            row=row, column=0, sticky=tk.W, pady=8)
+        if suffix is None:
+            ttk.Spinbox(parent, from_=lo, to=hi, width=8, textvariable=var, style="Green.TSpinbox").grid(
+                row=row, column=1, sticky=tk.W, padx=10, pady=8)
+        else:
+            spin_frame = ttk.Frame(parent, style="Green.TFrame")
+            spin_frame.grid(row=row, column=1, sticky=tk.W, padx=10, pady=8)
+            ttk.Spinbox(spin_frame, from_=lo, to=hi, width=5, textvariable=var, style="Green.TSpinbox").pack(side=tk.LEFT)
+            ttk.Label(spin_frame, text=suffix, style="Green.TLabel").pack(side=tk.LEFT)
+        ttk.Label(parent, text=hint, style="GreenSubtitle.TLabel").grid(
+            row=row, column=2, sticky=tk.W, pady=8)
     
     def on_string_type_change(self, event):
         """Handle string type change"""
@@ -731,47 +989,83 @@ class DualNBackGame:
     def apply_settings(self):
         """Apply all settings from UI to config"""
         try:
-            self.config.n_level = int(self.n_level_var.get())
-            self.config.grid_rows = int(self.grid_rows_var.get())
-            self.config.grid_cols = int(self.grid_cols_var.get())
-            self.config.total_rounds = int(self.total_rounds_var.get())
-            self.config.round_duration = int(self.round_duration_var.get()) * 1000
-            self.config.string_length = int(self.string_length_var.get())
-            self.config.string_type = self.string_type_var.get()
-            self.config.letter_case = self.letter_case_var.get()
+            self.config.n_level = self._spin_value("n_level")
+            self.config.grid_rows = self._spin_value("grid_rows")
+            self.config.grid_cols = self._spin_value("grid_cols")
+            self.config.total_rounds = self._spin_value("total_rounds")
+            self.config.round_duration = self._spin_value("round_duration") * 1000
+            self.config.string_length = self._spin_value("string_length")
+            string_type = self.string_type_var.get()
+            letter_case = self.letter_case_var.get()
+            if (string_type != self.config.string_type or
+                    letter_case != self.config.letter_case):
+                self.config.invalidate_char_pool()
+            self.config.string_type = string_type
+            self.config.letter_case = letter_case
+            
+            # Cell rectangles only depend on the grid size, so compute them
+            # here once instead of whenever the grid is drawn
+            rows, cols = self.config.grid_rows, self.config.grid_cols
+            size = self._cell_size = min(80, 400 // max(rows, cols))
+            self._cell_coords = [
+                (col * size + 5, row * size + 5, (col + 1) * size + 3, (row + 1) * size + 3)
+                for row in range(rows) for col in range(cols)
+            ]
             return True
         except ValueError as e:
             messagebox.showerror("Invalid Settings", f"Please check your settings: {e}")
             return False
     
+    def _spin_value(self, name):
+        """
+        Read a settings spinbox as an int. Spinboxes accept typed values
+        outside from_/to, so out-of-range values raise ValueError here.
+        """
+        label, lo, hi = self._spin_ranges[name]
+        value = int(getattr(self, name + "_var").get())
+        if not lo <= value <= hi:
+            raise ValueError(f"{label.rstrip(':')} must be between {lo} and {hi}")
+        return value
+    
     def start_game(self):
         """Initialize and start the game"""
         if not self.apply_settings():
             return
         
+        # Initialize the adaptive stimulus generator and build the full schedule.
+        # All generation happens here, before the first round, so next_round
+        # never runs generator code on the Tk event loop between rounds.
+        self.stimulus_generator = StimulusGenerator(self.config)
+        self.stimulus_schedule = self.stimulus_generator.generate_schedule(
+            self.config.total_rounds)
+        
         # Reset game state
         self.stats.reset()
-        self.history = []
+        self.history = deque(maxlen=self.config.n_level + 1)
+        self._n_back_target = None
         self.current_round = 0
+        self.current_position = None
+        self.current_string = None
         self.is_playing = True
         self.is_paused = False
         
-        # Initialize the adaptive stimulus generator
-        self.stimulus_generator = StimulusGenerator(self.config)
-        
         # Show game screen
         self.show_game_screen()
         
         # Start the game loop
+        self._gen += 1
+        self._next_deadline = time.monotonic_ns()
         self.next_round()
     
     def show_game_screen(self):
-        """Display the main game screen"""
-        self.clear_screen()
-        
+        """Display the main game screen, reset for a new game"""
+        self._show_screen("game", self._build_game_screen)
+        self._reset_game_screen()
+    
+    def _build_game_screen(self):
+        """Create the game screen widgets (once); per-game values are set in _reset_game_screen"""
         # Main container
         main_frame = ttk.Frame(self.root, style="Green.TFrame")
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Top bar - info and controls
         top_bar = ttk.Frame(main_frame, style="Green.TFrame")
@@ -781,17 +1075,27 @@ class DualNBackGame:
         level_frame = ttk.Frame(top_bar, style="Green.TFrame")
         level_frame.pack(side=tk.LEFT)
         
-        ttk.Label(level_frame, text=f"Level: {self.config.n_level}-Back",
-                 style="GreenBig.TLabel").pack(side=tk.LEFT)
+        self.level_label = ttk.Label(level_frame, style="GreenBig.TLabel")
+        self.level_label.pack(side=tk.LEFT)
+        
+        # Label texts that change during a game are bound to variables, so an
+        # update is a single variable write instead of a widget configure
+        self.round_var = tk.StringVar()
+        self.score_var = tk.StringVar()
+        self.string_display_var = tk.StringVar(value="---")
+        self.feedback_var = tk.StringVar(value="Get Ready...")
+        self.pos_hits_var = tk.StringVar()
+        self.pos_miss_var = tk.StringVar()
+        self.str_hits_var = tk.StringVar()
+        self.str_miss_var = tk.StringVar()
         
         # Round counter
-        self.round_label = ttk.Label(top_bar, 
-                                     text=f"Round: 0 / {self.config.total_rounds}",
+        self.round_label = ttk.Label(top_bar, textvariable=self.round_var,
                                      style="GreenBig.TLabel")
         self.round_label.pack(side=tk.LEFT, padx=50)
         
         # Score display
-        self.score_label = ttk.Label(top_bar, text="Score: 0",
+        self.score_label = ttk.Label(top_bar, textvariable=self.score_var,
                                      style="GreenBig.TLabel")
         self.score_label.pack(side=tk.RIGHT)
         
@@ -816,46 +1120,21 @@ class DualNBackGame:
         grid_container = ttk.Frame(game_area, style="Green.TFrame")
         grid_container.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        # Calculate cell size
-        cell_size = min(80, 400 // max(self.config.grid_rows, self.config.grid_cols))
-        
-        # Create grid canvas
-        grid_width = self.config.grid_cols * cell_size + 10
-        grid_height = self.config.grid_rows * cell_size + 10
-        
-        self.grid_canvas = tk.Canvas(grid_container, 
-                                     width=grid_width, height=grid_height,
-                                     bg=self.COLORS["bg_dark"],
+        # Create grid canvas (cells are drawn by _draw_grid)
+        self.grid_canvas = tk.Canvas(grid_container,
+                                     bg=self.COLORS.bg_dark,
                                      highlightthickness=0)
         self.grid_canvas.pack(anchor=tk.CENTER, pady=20)
-        
-        # Draw grid cells
-        self.grid_cells = []
-        for row in range(self.config.grid_rows):
-            row_cells = []
-            for col in range(self.config.grid_cols):
-                x1 = col * cell_size + 5
-                y1 = row * cell_size + 5
-                x2 = x1 + cell_size - 2
-                y2 = y1 + cell_size - 2
-                
-                cell = self.grid_canvas.create_rectangle(
-                    x1, y1, x2, y2,
-                    fill=self.COLORS["grid_empty"],
-                    outline=self.COLORS["grid_border"],
-                    width=2
-                )
-                row_cells.append(cell)
-            self.grid_cells.append(row_cells)
+        self._grid_shape = None
         
         # String display
-        self.string_display = ttk.Label(grid_container, text="---",
+        self.string_display = ttk.Label(grid_container, textvariable=self.string_display_var,
                                         style="GreenTitle.TLabel",
                                         font=("Consolas", 36, "bold"))
         self.string_display.pack(pady=20)
         
         # Status/feedback area
-        self.feedback_label = ttk.Label(grid_container, text="Get Ready...",
+        self.feedback_label = ttk.Label(grid_container, textvariable=self.feedback_var,
                                         style="Green.TLabel",
                                         font=("Segoe UI", 14))
         self.feedback_label.pack(pady=10)
@@ -872,25 +1151,29 @@ class DualNBackGame:
         
         # Position stats
         ttk.Label(stats_grid, text="Position", style="Green.TLabel",
-                 background=self.COLORS["bg_medium"]).grid(row=0, column=0, sticky=tk.W)
-        self.pos_hits_label = ttk.Label(stats_grid, text="Hits: 0", style="Green.TLabel",
-                                        background=self.COLORS["bg_medium"])
+                 background=self.COLORS.bg_medium).grid(row=0, column=0, sticky=tk.W)
+        self.pos_hits_label = ttk.Label(stats_grid, textvariable=self.pos_hits_var,
+                                        style="Green.TLabel",
+                                        background=self.COLORS.bg_medium)
         self.pos_hits_label.grid(row=1, column=0, sticky=tk.W)
-        self.pos_miss_label = ttk.Label(stats_grid, text="Miss: 0", style="Green.TLabel",
-                                        background=self.COLORS["bg_medium"])
+        self.pos_miss_label = ttk.Label(stats_grid, textvariable=self.pos_miss_var,
+                                        style="Green.TLabel",
+                                        background=self.COLORS.bg_medium)
         self.pos_miss_label.grid(row=2, column=0, sticky=tk.W)
         
         ttk.Label(stats_grid, text="   ", style="Green.TLabel",
-                 background=self.COLORS["bg_medium"]).grid(row=0, column=1)
+                 background=self.COLORS.bg_medium).grid(row=0, column=1)
         
         # String stats
         ttk.Label(stats_grid, text="String", style="Green.TLabel",
-                 background=self.COLORS["bg_medium"]).grid(row=0, column=2, sticky=tk.W)
-        self.str_hits_label = ttk.Label(stats_grid, text="Hits: 0", style="Green.TLabel",
-                                        background=self.COLORS["bg_medium"])
+                 background=self.COLORS.bg_medium).grid(row=0, column=2, sticky=tk.W)
+        self.str_hits_label = ttk.Label(stats_grid, textvariable=self.str_hits_var,
+                                        style="Green.TLabel",
+                                        background=self.COLORS.bg_medium)
         self.str_hits_label.grid(row=1, column=2, sticky=tk.W)
-        self.str_miss_label = ttk.Label(stats_grid, text="Miss: 0", style="Green.TLabel",
-                                        background=self.COLORS["bg_medium"])
+        self.str_miss_label = ttk.Label(stats_grid, textvariable=self.str_miss_var,
+                                        style="Green.TLabel",
+                                        background=self.COLORS.bg_medium)
         self.str_miss_label.grid(row=2, column=2, sticky=tk.W)
         
         # Separator
@@ -898,13 +1181,13 @@ class DualNBackGame:
         
         # Response buttons
         ttk.Label(right_panel, text="Response Buttons", style="Green.TLabel",
-                 background=self.COLORS["bg_medium"]).pack(pady=(0, 10))
+                 background=self.COLORS.bg_medium).pack(pady=(0, 10))
         
         # Position match button
         self.pos_button = tk.Button(right_panel, text="Position Match\n[A]",
-                                    bg=self.COLORS["bg_light"],
-                                    fg=self.COLORS["text"],
-                                    activebackground=self.COLORS["accent"],
+                                    bg=self.COLORS.bg_light,
+                                    fg=self.COLORS.text,
+                                    activebackground=self.COLORS.accent,
                                     font=("Segoe UI", 12, "bold"),
                                     width=15, height=3,
                                     command=self.check_position)
@@ -912,9 +1195,9 @@ class DualNBackGame:
         
         # String match button
         self.str_button = tk.Button(right_panel, text="String Match\n[L]",
-                                    bg=self.COLORS["bg_light"],
-                                    fg=self.COLORS["text"],
-                                    activebackground=self.COLORS["accent"],
+                                    bg=self.COLORS.bg_light,
+                                    fg=self.COLORS.text,
+                                    activebackground=self.COLORS.accent,
                                     font=("Segoe UI", 12, "bold"),
                                     width=15, height=3,
                                     command=self.check_string)
@@ -926,9 +1209,69 @@ class DualNBackGame:
         reminder = ttk.Label(right_panel, 
                             text="Press when current\nmatches N steps ago",
                             style="GreenSubtitle.TLabel",
-                            background=self.COLORS["bg_medium"],
+                            background=self.COLORS.bg_medium,
                             justify=tk.CENTER)
         reminder.pack()
+        
+        return main_frame
+    
+    def _draw_grid(self):
+        """(Re)create the grid cells for the configured grid size"""
+        rows, cols = self.config.grid_rows, self.config.grid_cols
+        cell_size = self._cell_size
+        self.grid_canvas.configure(width=cols * cell_size + 10,
+                                   height=rows * cell_size + 10)
+        
+        # Draw grid cells, tagged "cell" plus a per-cell "r{row}c{col}" tag.
+        # All rectangles are created by a single Tcl script whose result is
+        # the list of new item ids, instead of one create_rectangle per cell.
+        canvas = self.grid_canvas
+        canvas.delete("cell")
+        path = str(canvas)
+        cell_opts = (f"-fill {self._color.grid_empty} "
+                     f"-outline {self._color.grid_border} -width 2")
+        commands = []
+        for i, (x1, y1, x2, y2) in enumerate(self._cell_coords):
+            row, col = divmod(i, cols)
+            commands.append(f"[{path} create rectangle {x1} {y1} {x2} {y2} "
+                            f"{cell_opts} -tags {{cell r{row}c{col}}}]")
+        
+        # Commands were generated row-major, so ids are already in
+        # row * cols + col order
+        ids = canvas.tk.splitlist(canvas.tk.eval("list " + " ".join(commands)))
+        self.grid_cells = [int(item) for item in ids]
+        
+        self._grid_shape = (rows, cols)
+    
+    def _reset_game_screen(self):
+        """Reset the cached game screen's mutable widgets for a new game"""
+        if self._grid_shape != (self.config.grid_rows, self.config.grid_cols):
+            self._draw_grid()
+        else:
+            self.grid_canvas.itemconfigure("cell", fill=self._color.grid_empty)
+            self.grid_canvas.dtag("active")
+        
+        self._update_widget(self.level_label, text=f"Level: {self.config.n_level}-Back")
+        self.round_var.set(f"Round: 0 / {self.config.total_rounds}")
+        self._update_widget(self.pause_btn, text="⏸ Pause")
+        self._set_var(self.string_display_var, "---")
+        self.show_feedback("Get Ready...", self._color.text)
+        self.update_live_stats()
+    
+    def _update_widget(self, widget, **options):
+        """Configure a widget, skipping options that already have the requested value"""
+        rendered = self._rendered.setdefault(widget, {})
+        changed = {k: v for k, v in options.items() if rendered.get(k) != v}
+        if changed:
+            rendered.update(changed)
+            widget.configure(**changed)
+    
+    def _set_var(self, var, value):
+        """Set a label's bound variable, skipping the Tcl write when unchanged"""
+        name = str(var)
+        if self._var_values.get(name) != value:
+            self._var_values[name] = value
+            var.set(value)
     
     def next_round(self):
         """Execute the next round of the game"""
@@ -941,79 +1284,99 @@ class DualNBackGame:
             self.end_game()
             return
         
-        # Check for missed matches from previous round
-        if len(self.history) >= self.config.n_level:
-            n_back = self.history[-(self.config.n_level)]
-            
+        # Check for missed matches from previous round, against the same
+        # n-back target the buttons were checked against
+        n_back = self._n_back_target
+        if n_back is not None:
             if not self.position_pressed and self.current_position == n_back[0]:
                 self.stats.position_misses += 1
             
             if not self.string_pressed and self.current_string == n_back[1]:
                 self.stats.string_misses += 1
         
-        # Reset button states
+        # Reset response state
         self.position_pressed = False
         self.string_pressed = False
-        self.pos_button.configure(bg=self.COLORS["bg_light"])
-        self.str_button.configure(bg=self.COLORS["bg_light"])
-        
-        # Clear previous cell highlight
-        if self.current_position is not None:
-            row, col = self.current_position
-            self.grid_canvas.itemconfig(self.grid_cells[row][col], 
-                                        fill=self.COLORS["grid_empty"])
         
-        # Generate new position and string using adaptive stimulus generator
-        self.current_position, self.current_string, metadata = self.stimulus_generator.generate_stimulus()
-        new_row, new_col = self.current_position
+        # Take the next pre-generated position and string
+        self.current_position, self.current_string, metadata = self.stimulus_schedule[self.current_round - 1]
         
-        # Sync history with generator's history
-        self.history = self.stimulus_generator.history.copy()
+        self.history.append((self.current_position, self.current_string))
+        n = self.config.n_level
+        self._n_back_target = self.history[-(n + 1)] if len(self.history) > n else None
         
-        # Update display
-        self.grid_canvas.itemconfig(self.grid_cells[new_row][new_col],
-                                   fill=self.COLORS["grid_active"])
-        self.string_display.configure(text=self.current_string)
+        # Reset button states
+        self._update_widget(self.pos_button, bg=self._color.bg_light)
+        self._update_widget(self.str_button, bg=self._color.bg_light)
+        
+        # Update display: only the previous and the new cell change. The
+        # lit cell carries the "active" tag, so clearing it needs no lookup
+        canvas = self.grid_canvas
+        canvas.itemconfigure("active", fill=self._color.grid_empty)
+        canvas.dtag("active")
+        row, col = self.current_position
+        cell = self.grid_cells[row * self.config.grid_cols + col]
+        canvas.itemconfigure(cell, fill=self._color.grid_active)
+        canvas.addtag_withtag("active", cell)
+        self._set_var(self.string_display_var, self.current_string)
         
         # Update round counter
-        self.round_label.configure(text=f"Round: {self.current_round} / {self.config.total_rounds}")
+        self.round_var.set(f"Round: {self.current_round} / {self.config.total_rounds}")
         
-        # Update score display
-        score_data = self.stats.calculate_score()
-        self.score_label.configure(text=f"Score: {score_data['total_score']}")
+        # Update score and live stats (misses may have changed above);
+        # unchanged values are skipped
+        self.update_live_stats()
         
         # Clear feedback when match checking is possible
         if metadata.get("can_match", False):
-            self.feedback_label.configure(text="", foreground=self.COLORS["text"])
+            self.show_feedback("", self._color.text)
         else:
-            self.feedback_label.configure(
-                text=f"Watch and remember... ({self.config.n_level - len(self.history)} more)",
-                foreground=self.COLORS["text_dim"]
+            self.show_feedback(
+                f"Watch and remember... ({self.config.n_level - len(self.history)} more)",
+                self._color.text_dim
             )
         
-        # Schedule next round
-        self.timer_id = self.root.after(self.config.round_duration, self.next_round)
+        # Schedule next round against a monotonic deadline so that callback
+        # latency doesn't accumulate into drift over the game. If Tk stalled
+        # past the deadline (e.g. while the window was dragged), re-anchor on
+        # now and skip the missed slots instead of replaying them back to back
+        duration = self.config.round_duration * 1_000_000
+        now = time.monotonic_ns()
+        self._next_deadline += duration
+        if self._next_deadline <= now:
+            self._next_deadline = now + duration
+        delay_ms = max(1, (self._next_deadline - now) // 1_000_000)
+        self.timer_id = self.root.after(delay_ms, self._next_round_if, self._gen)
+        
+        # Redraw this round's changes once. Only idle tasks are run: a full
+        # update() would also dispatch events and could re-enter here
+        self.root.update_idletasks()
+    
+    def _next_round_if(self, gen):
+        """Timer callback: run next_round unless the game moved on since scheduling"""
+        if gen == self._gen:
+            self.next_round()
     
     def check_position(self):
         """Handle position match button press"""
         if not self.is_playing or self.is_paused or self.position_pressed:
             return
         
-        if len(self.history) < self.config.n_level + 1:
-            self.show_feedback("Too early!", self.COLORS["warning"])
+        n_back = self._n_back_target
+        if n_back is None:
+            self.show_feedback("Too early!", self._color.warning)
             return
         
         self.position_pressed = True
-        n_back = self.history[-(self.config.n_level + 1)]
         
         if self.current_position == n_back[0]:
             self.stats.position_hits += 1
-            self.pos_button.configure(bg=self.COLORS["success"])
-            self.show_feedback("Position ✓", self.COLORS["success"])
+            self._update_widget(self.pos_button, bg=self._color.success)
+            self.show_feedback("Position ✓", self._color.success)
         else:
             self.stats.position_false_alarms += 1
-            self.pos_button.configure(bg=self.COLORS["error"])
-            self.show_feedback("Position ✗", self.COLORS["error"])
+            self._update_widget(self.pos_button, bg=self._color.error)
+            self.show_feedback("Position ✗", self._color.error)
         
         self.update_live_stats()
     
@@ -1022,37 +1385,38 @@ class DualNBackGame:
         if not self.is_playing or self.is_paused or self.string_pressed:
             return
         
-        if len(self.history) < self.config.n_level + 1:
-            self.show_feedback("Too early!", self.COLORS["warning"])
+        n_back = self._n_back_target
+        if n_back is None:
+            self.show_feedback("Too early!", self._color.warning)
             return
         
         self.string_pressed = True
-        n_back = self.history[-(self.config.n_level + 1)]
         
         if self.current_string == n_back[1]:
             self.stats.string_hits += 1
-            self.str_button.configure(bg=self.COLORS["success"])
-            self.show_feedback("String ✓", self.COLORS["success"])
+            self._update_widget(self.str_button, bg=self._color.success)
+            self.show_feedback("String ✓", self._color.success)
         else:
             self.stats.string_false_alarms += 1
-            self.str_button.configure(bg=self.COLORS["error"])
-            self.show_feedback("String ✗", self.COLORS["error"])
+            self._update_widget(self.str_button, bg=self._color.error)
+            self.show_feedback("String ✗", self._color.error)
         
         self.update_live_stats()
     
     def show_feedback(self, message, color):
         """Show temporary feedback message"""
-        self.feedback_label.configure(text=message, foreground=color)
+        self._set_var(self.feedback_var, message)
+        self._update_widget(self.feedback_label, foreground=color)
     
     def update_live_stats(self):
         """Update the live statistics display"""
-        self.pos_hits_label.configure(text=f"Hits: {self.stats.position_hits}")
-        self.pos_miss_label.configure(text=f"Miss: {self.stats.position_misses}")
-        self.str_hits_label.configure(text=f"Hits: {self.stats.string_hits}")
-        self.str_miss_label.configure(text=f"Miss: {self.stats.string_misses}")
+        self._set_var(self.pos_hits_var, f"Hits: {self.stats.position_hits}")
+        self._set_var(self.pos_miss_var, f"Miss: {self.stats.position_misses}")
+        self._set_var(self.str_hits_var, f"Hits: {self.stats.string_hits}")
+        self._set_var(self.str_miss_var, f"Miss: {self.stats.string_misses}")
         
         score_data = self.stats.calculate_score()
-        self.score_label.configure(text=f"Score: {score_data['total_score']}")
+        self._set_var(self.score_var, f"Score: {score_data['total_score']}")
     
     def toggle_pause(self):
         """Pause or resume the game"""
@@ -1060,24 +1424,30 @@ class DualNBackGame:
             return
         
         self.is_paused = not self.is_paused
+        self._gen += 1
         
         if self.is_paused:
             if self.timer_id:
                 self.root.after_cancel(self.timer_id)
-            self.pause_btn.configure(text="▶ Resume")
-            self.feedback_label.configure(text="PAUSED - Press SPACE to resume",
-                                         foreground=self.COLORS["warning"])
+                self.timer_id = None
+            self._update_widget(self.pause_btn, text="▶ Resume")
+            self.show_feedback("PAUSED - Press SPACE to resume", self._color.warning)
         else:
-            self.pause_btn.configure(text="⏸ Pause")
-            self.feedback_label.configure(text="")
+            self._update_widget(self.pause_btn, text="⏸ Pause")
+            self.show_feedback("", self._color.text)
+            self._next_deadline = time.monotonic_ns()
             self.next_round()
     
     def end_game(self):
         """End the current game and show results"""
+        if not self.is_playing:
+            return  # e.g. Escape pressed outside a game
         self.is_playing = False
+        self._gen += 1
         
         if self.timer_id:
             self.root.after_cancel(self.timer_id)
+            self.timer_id = None
         
         # Calculate final score
         score_data = self.stats.calculate_score()
@@ -1090,10 +1460,39 @@ class DualNBackGame:
     
     def show_results_screen(self, score_data, high_score):
         """Display the game results"""
-        self.clear_screen()
+        self._show_screen("results", self._build_results_screen)
+        labels = self.result_labels
+        
+        # Big score display
+        labels["score"].configure(text=f"🏆 {score_data['total_score']}")
         
+        # High score indicator
+        if score_data['total_score'] >= high_score:
+            labels["high_score"].configure(text="🌟 NEW HIGH SCORE! 🌟",
+                                           style="Green.TLabel",
+                                           foreground=self.COLORS.warning,
+                                           font=("Segoe UI", 14, "bold"))
+        else:
+            labels["high_score"].configure(text=f"High Score: {high_score}",
+                                           style="GreenSubtitle.TLabel",
+                                           foreground="", font="")
+        
+        # Details
+        for kind in ("position", "string"):
+            labels[f"{kind}_accuracy"].configure(
+                text=f"Accuracy: {score_data[f'{kind}_accuracy']}%")
+            for key, caption in self.RESULT_DETAIL_ROWS:
+                labels[f"{kind}_{key}"].configure(
+                    text=f"{caption}: {score_data[f'{kind}_{key}']}")
+        
+        # Game info
+        labels["info"].configure(
+            text=f"Level: {self.config.n_level}-Back | Grid: {self.config.grid_rows}x{self.config.grid_cols} | Rounds: {self.config.total_rounds}")
+    
+    def _build_results_screen(self):
+        """Create the results screen widgets (once); values are filled in by show_results_screen"""
         main_frame = ttk.Frame(self.root, style="Green.TFrame")
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=40, pady=30)
+        self.result_labels = labels = {}
         
         # Title
         ttk.Label(main_frame, text="🎮 GAME COMPLETE",
@@ -1104,68 +1503,34 @@ class DualNBackGame:
                                      style="Green.TLabelframe", padding=30)
         score_frame.pack(fill=tk.X, pady=10)
         
-        # Big score display
-        score_text = f"🏆 {score_data['total_score']}"
-        ttk.Label(score_frame, text=score_text,
-                 style="GreenTitle.TLabel",
-                 font=("Segoe UI", 48, "bold")).pack()
-        
-        # High score indicator
-        if score_data['total_score'] >= high_score:
-            ttk.Label(score_frame, text="🌟 NEW HIGH SCORE! 🌟",
-                     style="Green.TLabel",
-                     foreground=self.COLORS["warning"],
-                     font=("Segoe UI", 14, "bold")).pack(pady=10)
-        else:
-            ttk.Label(score_frame, text=f"High Score: {high_score}",
-                     style="GreenSubtitle.TLabel").pack(pady=10)
+        labels["score"] = ttk.Label(score_frame, style="GreenTitle.TLabel",
+                                    font=("Segoe UI", 48, "bold"))
+        labels["score"].pack()
+        labels["high_score"] = ttk.Label(score_frame, style="GreenSubtitle.TLabel")
+        labels["high_score"].pack(pady=10)
         
         # Details
         details_frame = ttk.Frame(main_frame, style="Green.TFrame")
         details_frame.pack(fill=tk.X, pady=20)
         
-        # Position results
-        pos_frame = ttk.LabelFrame(details_frame, text=" Position Matching ",
+        for kind, title, padx in (("position", " Position Matching ", (0, 10)),
+                                  ("string", " String Matching ", (10, 0))):
+            frame = ttk.LabelFrame(details_frame, text=title,
                                    style="Green.TLabelframe", padding=20)
-        pos_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
-        
-        ttk.Label(pos_frame, 
-                 text=f"Accuracy: {score_data['position_accuracy']}%",
-                 style="GreenBig.TLabel").pack()
-        ttk.Label(pos_frame,
-                 text=f"Correct: {score_data['position_hits']}",
-                 style="Green.TLabel").pack()
-        ttk.Label(pos_frame,
-                 text=f"Missed: {score_data['position_misses']}",
-                 style="Green.TLabel").pack()
-        ttk.Label(pos_frame,
-                 text=f"False Alarms: {score_data['position_false_alarms']}",
-                 style="Green.TLabel").pack()
-        
-        # String results
-        str_frame = ttk.LabelFrame(details_frame, text=" String Matching ",
-                                   style="Green.TLabelframe", padding=20)
-        str_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 0))
-        
-        ttk.Label(str_frame,
-                 text=f"Accuracy: {score_data['string_accuracy']}%",
-                 style="GreenBig.TLabel").pack()
-        ttk.Label(str_frame,
-                 text=f"Correct: {score_data['string_hits']}",
-                 style="Green.TLabel").pack()
-        ttk.Label(str_frame,
-                 text=f"Missed: {score_data['string_misses']}",
-                 style="Green.TLabel").pack()
-        ttk.Label(str_frame,
-                 text=f"False Alarms: {score_data['string_false_alarms']}",
-                 style="Green.TLabel").pack()
+            frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=padx)
+            
+            labels[f"{kind}_accuracy"] = ttk.Label(frame, style="GreenBig.TLabel")
+            labels[f"{kind}_accuracy"].pack()
+            for key, _ in self.RESULT_DETAIL_ROWS:
+                labels[f"{kind}_{key}"] = ttk.Label(frame, style="Green.TLabel")
+                labels[f"{kind}_{key}"].pack()
         
         # Game info
         info_frame = ttk.Frame(main_frame, style="Green.TFrame")
         info_frame.pack(fill=tk.X, pady=10)
         
-        info_text = f"Level: {self.config.n_level}-Back | Grid: {self.config.grid_rows}x{self.config.grid_cols} | Rounds: {self.config.total_rounds}"
-        ttk.Label(info_frame, text=info_text, style="GreenSubtitle.TLabel").pack()
+        labels["info"] = ttk.Label(info_frame, style="GreenSubtitle.TLabel")
+        labels["info"].pack()
         
         # Buttons
         button_frame = ttk.Frame(main_frame, style="Green.TFrame")
@@ -1182,24 +1547,19 @@ class DualNBackGame:
         ttk.Button(button_frame, text="⚙ Settings",
                   style="GreenSecondary.TButton",
                   command=self.show_settings_screen).pack(side=tk.RIGHT, padx=10)
+        
+        return main_frame
     
     def show_statistics(self):
         """Show historical statistics"""
-        try:
-            stats_file = os.path.join(os.path.dirname(__file__), "game_stats.json")
-            if os.path.exists(stats_file):
-                with open(stats_file, 'r') as f:
-                    all_stats = json.load(f)
-            else:
-                all_stats = {"games": [], "high_scores": {}}
-        except:
-            all_stats = {"games": [], "high_scores": {}}
+        high_scores = self.stats.load_high_scores()
+        recent_games = self.stats.load_recent_games(20)
         
         # Create stats window
         stats_window = tk.Toplevel(self.root)
         stats_window.title("Game Statistics")
         stats_window.geometry("600x500")
-        stats_window.configure(bg=self.COLORS["bg_dark"])
+        stats_window.configure(bg=self.COLORS.bg_dark)
         
         main_frame = ttk.Frame(stats_window, style="Green.TFrame")
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
@@ -1207,7 +1567,12 @@ class DualNBackGame:
         ttk.Label(main_frame, text="📊 Statistics",
                  style="GreenTitle.TLabel").pack(pady=(0, 20))
         
-        if not all_stats["games"]:
+        # The per-row labels below never change style, so plain tk.Labels
+        # (same look as Green.TLabel) skip the ttk theme lookups
+        row_label = dict(bg=self._color.bg_dark, fg=self._color.text,
+                         font=("Segoe UI", 11))
+        
+        if not recent_games:
             ttk.Label(main_frame, text="No games played yet!",
                      style="Green.TLabel").pack(pady=20)
         else:
@@ -1216,11 +1581,11 @@ class DualNBackGame:
                                       style="Green.TLabelframe", padding=15)
             hs_frame.pack(fill=tk.X, pady=10)
             
-            for level, score in sorted(all_stats["high_scores"].items()):
+            for level, score in sorted(high_scores.items()):
                 level_num = level.replace("level_", "")
-                ttk.Label(hs_frame, 
+                tk.Label(hs_frame,
                          text=f"{level_num}-Back: {score} points",
-                         style="Green.TLabel").pack(anchor=tk.W)
+                         **row_label).pack(anchor=tk.W)
             
             # Recent games
             recent_frame = ttk.LabelFrame(main_frame, text=" Recent Games ",
@@ -1228,7 +1593,7 @@ class DualNBackGame:
             recent_frame.pack(fill=tk.BOTH, expand=True, pady=10)
             
             # Create scrollable list
-            canvas = tk.Canvas(recent_frame, bg=self.COLORS["bg_dark"],
+            canvas = tk.Canvas(recent_frame, bg=self.COLORS.bg_dark,
                               highlightthickness=0)
             scrollbar = ttk.Scrollbar(recent_frame, orient=tk.VERTICAL,
                                       command=canvas.yview)
@@ -1243,10 +1608,10 @@ class DualNBackGame:
             canvas.configure(yscrollcommand=scrollbar.set)
             
             # Add game records (last 20)
-            for game in reversed(all_stats["games"][-20:]):
+            for game in reversed(recent_games):
                 game_text = f"{game['date'][:10]} | {game['n_level']}-Back | Score: {game['score']} | Pos: {game['position_accuracy']}% | Str: {game['string_accuracy']}%"
-                ttk.Label(scrollable_frame, text=game_text,
-                         style="Green.TLabel").pack(anchor=tk.W, pady=2)
+                tk.Label(scrollable_frame, text=game_text,
+                         **row_label).pack(anchor=tk.W, pady=2)
             
             canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
             scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -1259,6 +1624,7 @@ class DualNBackGame:
 
 def main():
     """Main entry point"""
+    _import_tk()
     root = tk.Tk()
     
     # Center window on screen
@@ -15,6 +15,8 @@ except ImportError:
 
 def notify(title: str, message: str, duration: int = 5) -> None:
     """Display a Windows toast notification."""
+    # A fresh notifier per call: with threaded=True, win10toast drops a toast
+    # while the same instance's previous toast is still on screen
     toaster = ToastNotifier()
     toaster.show_toast(
         title,
@@ -51,6 +53,8 @@ def run_pomodoro(focus_time: int = 3, break_time: int = 1, number_of_cycles: int
             "🍅 Pomodoro - Focus Time",
             f"Cycle {cycle}/{number_of_cycles}: Time to focus for {focus_time} minutes!"
         )
+        # Plain sleep on purpose: on Windows, Ctrl+C interrupts time.sleep
+        # but not a timed Event.wait/lock acquire
         time.sleep(focus_seconds)
         
         # Break session (skip break after last cycle)